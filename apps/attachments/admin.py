@@ -1,9 +1,87 @@
 from django.contrib import admin
+from django.contrib.contenttypes.prefetch import GenericPrefetch
 from unfold.admin import ModelAdmin
+from unfold.views import ChangeList
+from ..shipments.models import Carrier, Driver, Shipment
 from . import models
 
 
+class AttachmentChangeList(ChangeList):
+    """
+    Changelist for AttachmentAdmin that restricts the SELECT to the columns rendered
+    in the list view, skipping the `description` TextField and unused user columns.
+
+    Applied here rather than in AttachmentAdmin.get_queryset so the change form keeps
+    loading full rows instead of fetching deferred fields one query at a time.
+    """
+
+    def get_queryset(self, request, exclude_parameters=None):
+        return (
+            super()
+            .get_queryset(request, exclude_parameters)
+            .only(
+                "file",
+                "uploaded_at",
+                "object_id",
+                "uploaded_by__username",
+                "content_type__app_label",
+                "content_type__model",
+            )
+        )
+
+
 @admin.register(models.Attachment)
 class AttachmentAdmin(ModelAdmin):
-    list_display = ["file", "uploaded_by", "uploaded_at", "content_type", "object_id"]
+    """
+    Custom admin class for the Attachment model.
+
+    Optimizations:
+    - Uses select_related for `uploaded_by` and `content_type` so each row renders
+        without extra lookups.
+    - Resolves the generic `content_object` with a GenericPrefetch, issuing one query
+        per content type on the page instead of one query per attachment.
+    - The changelist selects only the rendered columns (see AttachmentChangeList).
+
+    Attributes:
+    - list_display (list): Fields to display in the list view.
+    - list_filter (list): Enables filtering by upload date and content type.
+    """
+
+    list_display = [
+        "file",
+        "attached_to",
+        "uploaded_by",
+        "uploaded_at",
+        "content_type",
+        "object_id",
+    ]
     list_filter = ["uploaded_at", "content_type"]
+
+    def get_changelist(self, request, **kwargs):
+        return AttachmentChangeList
+
+    def get_queryset(self, request):
+        return (
+            super()
+            .get_queryset(request)
+            .select_related("uploaded_by", "content_type")
+            .prefetch_related(
+                GenericPrefetch(
+                    "content_object",
+                    [
+                        # Shipment.__str__ renders origin → destination
+                        Shipment.objects.select_related("origin", "destination"),
+                        Carrier.objects.all(),
+                        Driver.objects.all(),
+                    ],
+                )
+            )
+        )
+
+    @admin.display(description="Attached to")
+    def attached_to(self, attachment) -> str:
+        """
+        Displays the object the file is attached to, resolved from the prefetched
+        generic relation. Falls back to a dash if the target no longer exists.
+        """
+        return str(attachment.content_object or "—")
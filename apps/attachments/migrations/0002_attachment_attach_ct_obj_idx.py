@@ -0,0 +1,22 @@
+# Generated by Django 5.2 on 2026-10-15 22:36
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("attachments", "0001_initial"),
+        ("contenttypes", "0002_remove_content_type_name"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="attachment",
+            index=models.Index(
+                fields=["content_type", "object_id"], name="attach_ct_obj_idx"
+            ),
+        ),
+    ]
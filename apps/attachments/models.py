@@ -4,9 +4,9 @@ from django.contrib.contenttypes.fields import GenericForeignKey
 from django.conf import settings
 
 
-class AttachmentManager(models.Manager):
+class AttachmentQuerySet(models.QuerySet):
     """
-    Manager for the Attachment model.
+    QuerySet for the Attachment model.
 
     Methods:
     - get_attachments_for(obj_type, obj_id): Returns all attachments linked to the given model class and object ID.
@@ -14,6 +14,10 @@ class AttachmentManager(models.Manager):
     Notes:
     - Useful when the model class and primary key are known (e.g., from a serializer).
     - Assumes related objects use integer primary keys.
+    - ContentType lookups go through `ContentType.objects.get_for_model`, which is cached
+      per process by Django, so only the first call per model hits the database.
+    - Defined on the QuerySet so it chains after `select_related()` / `only()` and is
+      exposed on the manager through `AttachmentManager`.
     """
 
     def get_attachments_for(self, obj_type, obj_id):
@@ -31,6 +35,12 @@ class AttachmentManager(models.Manager):
         return self.filter(content_type=content_type, object_id=obj_id)
 
 
+class AttachmentManager(models.Manager.from_queryset(AttachmentQuerySet)):
+    """
+    Manager for the Attachment model, exposing the AttachmentQuerySet methods.
+    """
+
+
 class Attachment(models.Model):
     """
     Represents a file attachment that can be associated with any object.
@@ -48,6 +58,7 @@ class Attachment(models.Model):
     - Uses a GenericForeignKey to allow file attachments to any model instance.
     - Can be used for documents like invoices, proof of delivery, or images.
     - Assumes related models use integer primary keys.
+    - Indexed on (content_type, object_id) to keep generic lookups off a sequential scan.
     """
 
     objects = AttachmentManager()
@@ -64,5 +75,13 @@ class Attachment(models.Model):
 
     uploaded_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            # Supports the (content_type, object_id) lookups used by the generic relation
+            models.Index(
+                fields=["content_type", "object_id"], name="attach_ct_obj_idx"
+            ),
+        ]
+
     def __str__(self) -> str:
         return f"{self.file.name} attached to {self.content_type} {self.object_id}"
@@ -0,0 +1,28 @@
+# Generated by Django 5.2 on 2026-10-15 22:38
+
+import django.core.validators
+import re
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("locations", "0002_alter_location_postal_code_and_more"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="location",
+            name="postal_code",
+            field=models.CharField(
+                max_length=20,
+                validators=[
+                    django.core.validators.RegexValidator(
+                        message="Enter a valid US ZIP code (e.g., 12345 or 12345-6789).",
+                        regex=re.compile("^\\d{5}(?:-\\d{4})?$"),
+                    )
+                ],
+            ),
+        ),
+    ]
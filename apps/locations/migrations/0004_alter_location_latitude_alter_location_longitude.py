@@ -0,0 +1,23 @@
+# Generated by Django 5.2 on 2026-10-15 22:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("locations", "0003_alter_location_postal_code"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="location",
+            name="latitude",
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name="location",
+            name="longitude",
+            field=models.FloatField(blank=True, null=True),
+        ),
+    ]
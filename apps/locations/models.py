@@ -1,6 +1,6 @@
 from django.db import models
 from django.core.exceptions import ValidationError
-from django.core.validators import RegexValidator
+from .validators import postal_code_validator
 
 
 class Location(models.Model):
@@ -15,8 +15,8 @@ class Location(models.Model):
         state (str): State or province abbreviation (e.g., 'TX').
         postal_code (str): ZIP or postal code (validated for US format).
         country (str): ISO country code (e.g., 'US').
-        latitude (Decimal): Optional latitude for mapping.
-        longitude (Decimal): Optional longitude for mapping.
+        latitude (float): Optional latitude for mapping.
+        longitude (float): Optional longitude for mapping.
         created_at (datetime): Timestamp when the location was created.
         updated_at (datetime): Timestamp when the location was last updated.
 
@@ -35,23 +35,12 @@ class Location(models.Model):
     address_line2 = models.CharField(max_length=255, blank=True, null=True)
     city = models.CharField(max_length=100)
     state = models.CharField(max_length=100)
-    postal_code = models.CharField(
-        max_length=20,
-        validators=[
-            RegexValidator(
-                regex=r"^\d{5}(-\d{4})?$",
-                message="Enter a valid US ZIP code (e.g., 12345 or 12345-6789).",
-            )
-        ],
-    )
+    postal_code = models.CharField(max_length=20, validators=[postal_code_validator])
     country = models.CharField(max_length=2, default="US")
 
-    latitude = models.DecimalField(
-        max_digits=9, decimal_places=6, blank=True, null=True
-    )
-    longitude = models.DecimalField(
-        max_digits=9, decimal_places=6, blank=True, null=True
-    )
+    # Stored as double precision so distance math runs on native floats (in Python and SQL)
+    latitude = models.FloatField(blank=True, null=True)
+    longitude = models.FloatField(blank=True, null=True)
 
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
@@ -74,7 +63,8 @@ class Location(models.Model):
         return self.name
 
     def clean(self) -> None:
-        if bool(self.latitude) != bool(self.longitude):
+        # Compare against None so 0.0 (equator / prime meridian) counts as a provided value
+        if (self.latitude is None) != (self.longitude is None):
             raise ValidationError(
                 "Both latitude and longitude must be provided together."
             )
@@ -0,0 +1,8 @@
+import re
+from django.core.validators import RegexValidator
+
+
+postal_code_validator = RegexValidator(
+    regex=re.compile(r"^\d{5}(?:-\d{4})?$"),
+    message="Enter a valid US ZIP code (e.g., 12345 or 12345-6789).",
+)
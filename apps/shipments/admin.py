@@ -1,14 +1,20 @@
-from typing import Any, Sequence
 from django.contrib import admin
 from django.db.models.query import QuerySet
-from django.db.models import Count
+from django.db.models import Count, IntegerField
+from django.db.models.functions import Coalesce
 from django.urls import reverse
-from django.utils.html import format_html, urlencode
+from django.utils.functional import cached_property
+from django.utils.html import format_html
 from django.utils.safestring import SafeText
 from . import models
 from unfold.admin import ModelAdmin
+from unfold.views import ChangeList
 from django.db.models import OuterRef, Subquery
 
+# Shared by the count columns that link to a filtered changelist; the URL and
+# count are passed as format_html arguments so both are escaped.
+_LINK_TMPL = "<a href='{}'>{}</a>"
+
 
 class DriverCapacityFilter(admin.SimpleListFilter):
     """
@@ -20,31 +26,30 @@ class DriverCapacityFilter(admin.SimpleListFilter):
         - At Capacity (2-3)
         - Over Capacity (≥ 4)
 
-    This filter annotates each Carrier with a 'driver_count' using
-    an aggregate Count of related Driver records.
+    Filters on the 'driver_count' annotation added by CarrierAdmin.get_queryset,
+    so the driver count subquery is only emitted once.
     """
 
     title = "Driver Capacity"
     parameter_name = "capacity"
+    _LOOKUPS = (
+        ("lte1", "Under Capacity (≤ 1)"),
+        ("btw2_3", "At Capacity (2-3)"),
+        ("gte4", "Over Capacity (≥ 4)"),
+    )
 
-    def lookups(self, request, model_admin) -> list[tuple[str, str]]:
-        return [
-            ("lte1", "Under Capacity (≤ 1)"),
-            ("btw2_3", "At Capacity (2-3)"),
-            ("gte4", "Over Capacity (≥ 4)"),
-        ]
+    def lookups(self, request, model_admin) -> tuple[tuple[str, str], ...]:
+        return self._LOOKUPS
 
     def queryset(self, request, queryset: QuerySet) -> QuerySet:
-        # Add driver count annotation for filtering
-        annotated = queryset.annotate(driver_count=Count("drivers"))
         value = self.value()
         if value == "lte1":
-            return annotated.filter(driver_count__lte=1)
+            return queryset.filter(driver_count__lte=1)
         elif value == "btw2_3":
-            return annotated.filter(driver_count__gte=2, driver_count__lte=3)
+            return queryset.filter(driver_count__gte=2, driver_count__lte=3)
         elif value == "gte4":
-            return annotated.filter(driver_count__gte=4)
-        return annotated
+            return queryset.filter(driver_count__gte=4)
+        return queryset
 
 
 @admin.register(models.Carrier)
@@ -55,17 +60,18 @@ class CarrierAdmin(ModelAdmin):
     Enhancements:
         - Displays the number of available drivers via a clickable link.
         - Annotates each Carrier with a precomputed driver count to avoid N+1 queries.
-        - Applies prefetching on 'drivers' to reduce query count for related lookups.
 
     Attributes:
         list_display: Fields and computed values to show in the list view.
         list_filter: Custom filters, including DriverCapacityFilter for segmentation.
-        search_fields: Enables partial matching on Carrier name and MC number.
+        search_fields: Prefix matching on Carrier name and exact (case-insensitive)
+            matching on MC number, both backed by functional indexes.
+        show_full_result_count: Disabled to avoid a second COUNT query per page.
+        list_per_page: Caps the rows (and driver count subqueries) rendered per page.
 
     Methods:
         get_queryset(request):
-            Annotates the queryset with 'driver_count' (Count of related Drivers)
-            and prefetches the reverse FK to avoid extra queries.
+            Annotates the queryset with 'driver_count' (subquery count of related Drivers).
 
         available_drivers(carrier):
             Displays the number of related Drivers as a clickable link to
@@ -84,12 +90,20 @@ class CarrierAdmin(ModelAdmin):
     ]
 
     list_filter = [DriverCapacityFilter]
-    search_fields = ["name__istartswith", "mc_number__istartswith"]
+    search_fields = ["name__istartswith", "=mc_number"]
+    # Skip the unfiltered total; only the (annotated) filtered COUNT is run per page
+    show_full_result_count = False
+    list_per_page = 50
 
     def get_queryset(self, request):
-        # Efficiently fetch driver count and prefetch drivers to avoid N+1 issues
-        qs = super().get_queryset(request)
-        return qs.annotate(driver_count=Count("drivers")).prefetch_related("drivers")
+        # Only the driver count is rendered, so no Driver rows are fetched.
+        # The subquery avoids a JOIN + GROUP BY over every Carrier column.
+        return super().get_queryset(request).with_driver_count()
+
+    @cached_property
+    def driver_changelist_url(self) -> str:
+        # Resolved once per admin instance instead of once per rendered row
+        return reverse("admin:shipments_driver_changelist")
 
     @admin.display(ordering="driver_count")
     def available_drivers(self, carrier) -> SafeText:
@@ -97,13 +111,10 @@ class CarrierAdmin(ModelAdmin):
         Returns the number of drivers associated with the carrier
         as a clickable link to the filtered Driver changelist.
         """
-        drivers_changelist_url = (
-            reverse("admin:shipments_driver_changelist")
-            + "?"
-            + urlencode({"carrier__id": str(carrier.id)})
-        )
         return format_html(
-            f"<a href='{drivers_changelist_url}'>{carrier.driver_count}</a>"
+            _LINK_TMPL,
+            f"{self.driver_changelist_url}?carrier__id={carrier.id}",
+            carrier.driver_count,
         )
 
     def get_readonly_fields(self, request, obj=None):
@@ -130,42 +141,6 @@ class CarrierContactAdmin(ModelAdmin):
     list_select_related = ["carrier"]
 
 
-class CurrentStatusFilter(admin.SimpleListFilter):
-    """
-    Custom filter for Shipment list view that filters shipments by their
-    most recent status event.
-
-    Implements a subquery to annotate each Shipment with its latest status,
-    then applies a filter based on the selected value.
-
-    Options are derived from the ShipmentStatusEvent.Status choices.
-    """
-
-    title = "Current Status"
-    parameter_name = "current_status"
-
-    def lookups(
-        self, request, model_admin
-    ) -> Sequence[tuple[models.ShipmentStatusEvent.Status, str]]:
-        return models.ShipmentStatusEvent.Status.choices
-
-    def queryset(self, request, queryset) -> QuerySet[Any]:
-        if self.value():
-            # Subquery to get latest status per shipment
-            latest_status_subquery = models.ShipmentStatusEvent.objects.filter(
-                shipment=OuterRef("pk")
-            ).order_by("-event_timestamp")
-
-            # Annotate each shipment with the latest status
-            queryset = queryset.annotate(
-                latest_status=Subquery(latest_status_subquery.values("status")[:1])
-            )
-
-            return queryset.filter(latest_status=self.value())
-
-        return queryset
-
-
 class ShipmentItemsInline(admin.TabularInline):
     """
     Inline configuration for displaying ShipmentItems within a Shipment form.
@@ -185,27 +160,56 @@ class ShipmentItemsInline(admin.TabularInline):
         return qs.select_related("asset")  # Prevents per-row asset lookups
 
 
+class ShipmentChangeList(ChangeList):
+    """
+    Changelist for ShipmentAdmin that restricts the SELECT to the columns rendered
+    in the list view.
+
+    Applied here rather than in ShipmentAdmin.get_queryset so the change form keeps
+    loading full rows instead of fetching deferred fields one query at a time.
+    """
+
+    def get_queryset(self, request, exclude_parameters=None):
+        return (
+            super()
+            .get_queryset(request, exclude_parameters)
+            .only(
+                "current_status",
+                "origin__name",
+                "destination__name",
+                "carrier__name",
+                "driver__first_name",
+                "driver__last_name",
+                "vehicle__plate_number",
+            )
+        )
+
+
 @admin.register(models.Shipment)
 class ShipmentAdmin(ModelAdmin):
     """
     Custom admin class for the Shipment model.
 
     Optimizations:
-    - Annotates each Shipment with its latest status to avoid N+1 queries
-        caused by the `current_status` property.
-    - Uses select_related for all forward foreign keys displayed in the list view,
-        including chained lookups needed by __str__ methods (e.g., vehicle__carrier, driver__carrier).
+    - Reads the denormalized `current_status` column, so neither the list view nor the
+        status filter needs a per-row subquery over ShipmentStatusEvent.
+    - Uses select_related for the forward foreign keys displayed in the list view.
+        Driver and Vehicle __str__ only read their own columns, so their carriers
+        are not joined.
     - Includes inline editing for associated ShipmentItems with optimized asset lookup.
+    - The changelist selects only the rendered columns (see ShipmentChangeList).
 
     Attributes:
     - autocomplete_fields: Reduces load on dropdowns for high-volume FK fields.
     - inlines: Shows ShipmentItems inline within the Shipment form.
-    - list_display: Displays key relationships and annotated current status.
+    - list_display: Displays key relationships and the current status.
     - list_select_related: Ensures efficient FK resolution in the list view.
-    - list_filter: Enables filtering by carrier and annotated current status.
+    - list_filter: Enables filtering by carrier and current status (indexed column).
+    - list_per_page: Caps the rows (and joined related objects) rendered per page.
+    - show_full_result_count: Disabled to avoid a second COUNT query per page.
     """
 
-    autocomplete_fields = ["carrier", "driver", "vehicle"]
+    autocomplete_fields = ["origin", "destination", "carrier", "driver", "vehicle"]
     inlines = [ShipmentItemsInline]
     list_display = [
         "origin",
@@ -216,40 +220,16 @@ class ShipmentAdmin(ModelAdmin):
         "vehicle",
     ]
     list_select_related = ["carrier", "driver", "vehicle", "origin", "destination"]
-    list_filter = ["carrier", CurrentStatusFilter]
+    list_filter = ["carrier", "current_status"]
+    list_per_page = 50
+    show_full_result_count = False
+
+    def get_changelist(self, request, **kwargs):
+        return ShipmentChangeList
 
     def get_queryset(self, request):
         # Base queryset with select_related for all necessary forward FKs
-        qs = (
-            super()
-            .get_queryset(request)
-            .select_related(
-                "carrier",
-                "driver",
-                "driver__carrier",  # Required due to Driver.__str__()
-                "vehicle",
-                "vehicle__carrier",  # Required due to Vehicle.__str__()
-                "origin",
-                "destination",
-            )
-        )
-
-        # Annotate the latest status using a subquery for efficient filtering and display
-        latest_status_subquery = models.ShipmentStatusEvent.objects.filter(
-            shipment=OuterRef("pk")
-        ).order_by("-event_timestamp")
-
-        return qs.annotate(
-            latest_status=Subquery(latest_status_subquery.values("status")[:1])
-        )
-
-    @admin.display(ordering="latest_status")
-    def current_status(self, obj) -> str:
-        """
-        Displays the most recent status for the shipment, derived from
-        the latest related ShipmentStatusEvent. Falls back to a dash if unavailable.
-        """
-        return obj.latest_status or "—"
+        return super().get_queryset(request).with_related()
 
 
 @admin.register(models.ShipmentStatusEvent)
@@ -271,6 +251,8 @@ class DriverAdmin(ModelAdmin):
 
     Attributes:
     - list_display (list): Fields to display in the list view.
+    - list_per_page (int): Caps the rows (and shipment count subqueries) rendered per page.
+    - show_full_result_count (bool): Disabled to avoid a second COUNT query per page.
     """
 
     list_display = [
@@ -284,35 +266,60 @@ class DriverAdmin(ModelAdmin):
 
     search_fields = ["first_name__istartswith", "last_name__istartswith"]
     list_select_related = ["carrier"]
+    list_per_page = 50
+    show_full_result_count = False
 
     def get_queryset(self, request) -> QuerySet:
         """
-        Annotates the queryset with the number of shipements associated with each driver.
+        Annotates the queryset with the number of completed (delivered) shipments
+        associated with each driver.
+
+        Uses a correlated subquery instead of a JOIN + GROUP BY so the count only
+        touches the driver's delivered shipments (`current_status` Delivered), backed by
+        the (driver, current_status) index on Shipment.
 
         Returns:
         - The annotated queryset.
         """
+        delivered_count_subquery = (
+            models.Shipment.objects.filter(
+                driver=OuterRef("pk"),
+                current_status=models.ShipmentStatusEvent.Status.DELIVERED,
+            )
+            .order_by()  # Drop Shipment.Meta.ordering from the GROUP BY
+            .values("driver")
+            .annotate(count=Count("pk"))
+            .values("count")
+        )
         return (
             super()
             .get_queryset(request)
-            .annotate(completed_shipments=Count("shipment"))
+            .annotate(
+                completed_shipments=Coalesce(
+                    Subquery(delivered_count_subquery, output_field=IntegerField()), 0
+                )
+            )
             .select_related("carrier")
         )
 
+    @cached_property
+    def shipment_changelist_url(self) -> str:
+        # Resolved once per admin instance instead of once per rendered row
+        return reverse("admin:shipments_shipment_changelist")
+
     @admin.display(ordering="completed_shipments")
     def completed_shipments(self, driver) -> SafeText:
         """
-        Returns the number of shipments associated with the driver as a clickable link.
+        Returns the number of delivered shipments associated with the driver as a clickable link.
 
-        The link redirects to the Shipments admin page, filtered by the selected Driver.
+        The link redirects to the Shipments admin page, filtered by the selected Driver
+        and the Delivered status, so it lists exactly the shipments counted here.
         """
-        shipment_chagelist_url = (
-            reverse("admin:shipments_shipment_changelist")
-            + "?"
-            + urlencode({"driver_id": str(driver.id)})
-        )
         return format_html(
-            f"<a href='{shipment_chagelist_url}'>{driver.completed_shipments}</a>"
+            _LINK_TMPL,
+            f"{self.shipment_changelist_url}?driver_id={driver.id}"
+            f"&current_status__exact={models.ShipmentStatusEvent.Status.DELIVERED}",
+            driver.completed_shipments,
         )
 
 
@@ -0,0 +1,60 @@
+# Generated by Django 5.2 on 2026-10-15 22:38
+
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def backfill_current_status(apps, schema_editor):
+    """
+    Populates Shipment.current_status and current_status_at from each shipment's
+    latest status event, in a single UPDATE. Shipments without events keep the
+    "pending" default and a null timestamp.
+    """
+    Shipment = apps.get_model("shipments", "Shipment")
+    ShipmentStatusEvent = apps.get_model("shipments", "ShipmentStatusEvent")
+
+    latest_event = ShipmentStatusEvent.objects.filter(shipment=OuterRef("pk")).order_by(
+        "-event_timestamp"
+    )
+    Shipment.objects.filter(status_events__isnull=False).update(
+        current_status=Subquery(latest_event.values("status")[:1]),
+        current_status_at=Subquery(latest_event.values("event_timestamp")[:1]),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("shipments", "0042_carrier_deleted_at"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="shipment",
+            name="current_status",
+            field=models.CharField(
+                choices=[
+                    ("pending", "Pending"),
+                    ("in_transit", "In Transit"),
+                    ("delivered", "Delivered"),
+                    ("delayed", "Delayed"),
+                    ("cancelled", "Cancelled"),
+                ],
+                default="pending",
+                editable=False,
+                help_text="Latest status event for this shipment (maintained automatically).",
+                max_length=20,
+            ),
+        ),
+        migrations.AddField(
+            model_name="shipment",
+            name="current_status_at",
+            field=models.DateTimeField(
+                blank=True,
+                editable=False,
+                help_text="Timestamp of the latest status event (maintained automatically).",
+                null=True,
+            ),
+        ),
+        migrations.RunPython(backfill_current_status, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 5.2 on 2026-10-15 22:42
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # CREATE INDEX CONCURRENTLY can't run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ("shipments", "0043_shipment_current_status"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="shipment",
+            index=models.Index(fields=["current_status"], name="shipment_status_idx"),
+        ),
+        AddIndexConcurrently(
+            model_name="shipment",
+            index=models.Index(
+                fields=["driver", "current_status"], name="shipment_driver_status_idx"
+            ),
+        ),
+    ]
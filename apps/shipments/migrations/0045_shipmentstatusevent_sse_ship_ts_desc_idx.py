@@ -0,0 +1,22 @@
+# Generated by Django 5.2 on 2026-10-15 22:43
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # CREATE INDEX CONCURRENTLY can't run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ("shipments", "0044_shipment_status_indexes"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="shipmentstatusevent",
+            index=models.Index(
+                fields=["shipment", "-event_timestamp"], name="sse_ship_ts_desc_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,48 @@
+# Generated by Django 5.2 on 2026-10-15 22:45
+
+import django.contrib.postgres.indexes
+import django.db.models.functions.text
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # CREATE INDEX CONCURRENTLY can't run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ("shipments", "0045_shipmentstatusevent_sse_ship_ts_desc_idx"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="carrier",
+            index=models.Index(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("name"),
+                    name="text_pattern_ops",
+                ),
+                name="carrier_name_upper_like_idx",
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="driver",
+            index=models.Index(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("first_name"),
+                    name="text_pattern_ops",
+                ),
+                name="driver_first_upper_like_idx",
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="driver",
+            index=models.Index(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("last_name"),
+                    name="text_pattern_ops",
+                ),
+                name="driver_last_upper_like_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.2 on 2026-10-15 22:47
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("shipments", "0046_carrier_driver_search_indexes"),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name="carrier",
+            constraint=models.UniqueConstraint(
+                django.db.models.functions.text.Upper("mc_number"),
+                name="unique_upper_mc_number",
+                violation_error_message="This MC number already exists.",
+            ),
+        ),
+        migrations.AlterConstraint(
+            model_name="asset",
+            name="unique_upper_sku",
+            constraint=models.UniqueConstraint(
+                django.db.models.functions.text.Upper("sku"),
+                name="unique_upper_sku",
+                violation_error_message="This SKU already exists.",
+            ),
+        ),
+    ]
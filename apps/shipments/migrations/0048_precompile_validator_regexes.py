@@ -0,0 +1,87 @@
+# Generated by Django 5.2 on 2026-10-15 22:47
+
+import django.core.validators
+import re
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("shipments", "0047_carrier_unique_upper_mc_number"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="asset",
+            name="sku",
+            field=models.CharField(
+                max_length=64,
+                validators=[
+                    django.core.validators.RegexValidator(
+                        message="SKU must be in the format 'AST' followed by 4 digits (e.g., AST0001).",
+                        regex=re.compile("^AST\\d{4}$", 2),
+                    )
+                ],
+            ),
+        ),
+        migrations.AlterField(
+            model_name="carrier",
+            name="mc_number",
+            field=models.CharField(
+                max_length=50,
+                validators=[
+                    django.core.validators.RegexValidator(
+                        message="MC number must be in the format 'MC' followed by 6 digits (e.g., MC123456).",
+                        regex=re.compile("^MC\\d{6}$", 2),
+                    )
+                ],
+            ),
+        ),
+        migrations.AlterField(
+            model_name="carriercontact",
+            name="phone_number",
+            field=models.CharField(
+                blank=True,
+                help_text="Format: 832-123-4567 or 8321234567",
+                max_length=12,
+                null=True,
+                validators=[
+                    django.core.validators.RegexValidator(
+                        message="Enter a 10-digit phone number in format 555-123-4567 or 5551234567.",
+                        regex=re.compile("^\\d{3}-?\\d{3}-?\\d{4}$"),
+                    )
+                ],
+            ),
+        ),
+        migrations.AlterField(
+            model_name="driver",
+            name="phone_number",
+            field=models.CharField(
+                blank=True,
+                help_text="Format: 832-123-4567 or 8321234567",
+                max_length=12,
+                null=True,
+                validators=[
+                    django.core.validators.RegexValidator(
+                        message="Enter a 10-digit phone number in format 555-123-4567 or 5551234567.",
+                        regex=re.compile("^\\d{3}-?\\d{3}-?\\d{4}$"),
+                    )
+                ],
+            ),
+        ),
+        migrations.AlterField(
+            model_name="vehicle",
+            name="plate_number",
+            field=models.CharField(
+                max_length=20,
+                unique=True,
+                validators=[
+                    django.core.validators.RegexValidator(
+                        message="Enter a valid plate number using letters, numbers, or hyphens only (no spaces or special characters).",
+                        regex=re.compile("^[A-Za-z0-9-]{1,20}$"),
+                    )
+                ],
+            ),
+        ),
+    ]
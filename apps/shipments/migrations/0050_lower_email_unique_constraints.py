@@ -0,0 +1,53 @@
+# Generated by Django 5.2 on 2026-10-15 22:50
+
+import django.db.models.functions.text
+from django.db import migrations, models
+from django.db.models.functions import Lower
+
+
+def lowercase_emails(apps, schema_editor):
+    """
+    Lowercases stored emails so existing rows satisfy the LOWER(email) unique
+    constraints added below. save() has always lowercased, so this only touches
+    rows written around the model (fixtures, raw SQL).
+    """
+    for model_name in ("CarrierContact", "Driver"):
+        model = apps.get_model("shipments", model_name)
+        model.objects.exclude(email=Lower("email")).update(email=Lower("email"))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("shipments", "0049_shipment_shipment_carrier_pickup_idx"),
+    ]
+
+    operations = [
+        migrations.RunPython(lowercase_emails, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name="carriercontact",
+            name="email",
+            field=models.EmailField(max_length=254),
+        ),
+        migrations.AlterField(
+            model_name="driver",
+            name="email",
+            field=models.EmailField(max_length=254),
+        ),
+        migrations.AddConstraint(
+            model_name="carriercontact",
+            constraint=models.UniqueConstraint(
+                django.db.models.functions.text.Lower("email"),
+                name="unique_lower_email_contact",
+                violation_error_message="A contact with this email already exists.",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="driver",
+            constraint=models.UniqueConstraint(
+                django.db.models.functions.text.Lower("email"),
+                name="unique_lower_email_driver",
+                violation_error_message="A driver with this email already exists.",
+            ),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2 on 2026-10-15 22:50
+
+import django.db.models.expressions
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("shipments", "0050_lower_email_unique_constraints"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="asset",
+            name="volume_cubic_in",
+            field=models.GeneratedField(
+                db_persist=True,
+                expression=django.db.models.expressions.CombinedExpression(
+                    django.db.models.expressions.CombinedExpression(
+                        models.F("length_in"), "*", models.F("width_in")
+                    ),
+                    "*",
+                    models.F("height_in"),
+                ),
+                output_field=models.DecimalField(decimal_places=6, max_digits=21),
+            ),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2 on 2026-10-15 22:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("shipments", "0051_asset_volume_cubic_in"),
+    ]
+
+    operations = [
+        migrations.AlterConstraint(
+            model_name="carriercontact",
+            name="unique_primary_contact_per_carrier",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("is_primary", True)),
+                fields=("carrier",),
+                name="unique_primary_contact_per_carrier",
+                violation_error_message="This carrier already has a primary contact.",
+            ),
+        ),
+    ]
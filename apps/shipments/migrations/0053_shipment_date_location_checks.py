@@ -0,0 +1,79 @@
+# Generated by Django 5.2 on 2026-10-15 22:54
+
+from django.db import migrations, models
+from django.db.models import F, Q
+
+
+def check_existing_shipments(apps, schema_editor):
+    """
+    Stops the migration if existing shipments violate the constraints added below,
+    listing them by constraint so they can be corrected by hand first. Rows could be
+    written around Shipment.clean(), e.g. by the status-event receiver stamping
+    actual_pickup from an In Transit event recorded after delivery.
+
+    Shipment data is never rewritten here.
+    """
+    Shipment = apps.get_model("shipments", "Shipment")
+
+    rules = {
+        "shipment_scheduled_delivery_after_pickup": Q(
+            scheduled_delivery__lt=F("scheduled_pickup")
+        ),
+        "shipment_actual_delivery_after_pickup": Q(
+            actual_delivery__lt=F("actual_pickup")
+        ),
+        "shipment_origin_not_destination": Q(origin=F("destination")),
+    }
+    violations = {}
+    for name, violation in rules.items():
+        pks = list(Shipment.objects.filter(violation).values_list("pk", flat=True))
+        if pks:
+            violations[name] = pks
+    if violations:
+        details = "; ".join(f"{name}: {pks}" for name, pks in violations.items())
+        raise RuntimeError(
+            f"Fix these shipments before adding the check constraints: {details}"
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("locations", "0004_alter_location_latitude_alter_location_longitude"),
+        ("shipments", "0052_carriercontact_primary_violation_message"),
+    ]
+
+    operations = [
+        migrations.RunPython(check_existing_shipments, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name="shipment",
+            constraint=models.CheckConstraint(
+                condition=models.Q(
+                    ("scheduled_delivery__gte", models.F("scheduled_pickup"))
+                ),
+                name="shipment_scheduled_delivery_after_pickup",
+                violation_error_message="Scheduled delivery cannot be before scheduled pickup.",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="shipment",
+            constraint=models.CheckConstraint(
+                condition=models.Q(
+                    ("actual_pickup__isnull", True),
+                    ("actual_delivery__isnull", True),
+                    ("actual_delivery__gte", models.F("actual_pickup")),
+                    _connector="OR",
+                ),
+                name="shipment_actual_delivery_after_pickup",
+                violation_error_message="Actual delivery cannot be before actual pickup.",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="shipment",
+            constraint=models.CheckConstraint(
+                condition=models.Q(("origin", models.F("destination")), _negated=True),
+                name="shipment_origin_not_destination",
+                violation_error_message="Origin and destination cannot be the same.",
+            ),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2 on 2026-10-15 22:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("shipments", "0053_shipment_date_location_checks"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="asset",
+            name="slug",
+            field=models.SlugField(blank=True, editable=False, unique=True),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2 on 2026-10-15 22:58
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # CREATE INDEX CONCURRENTLY can't run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ("locations", "0004_alter_location_latitude_alter_location_longitude"),
+        ("shipments", "0054_asset_hashed_slug"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="shipment",
+            index=models.Index(fields=["scheduled_pickup"], name="shipment_pickup_idx"),
+        ),
+    ]
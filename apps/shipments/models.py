@@ -1,14 +1,30 @@
+import hashlib
+import operator
 import uuid
 from decimal import Decimal
 from typing import Literal
-from autoslug import AutoSlugField
-from django.db import models
+from django.db import IntegrityError, models, transaction
 from django.utils import timezone
+from django.utils.text import slugify
 from django.core.exceptions import ValidationError
 from django.core.validators import MinValueValidator
 from django.core.validators import RegexValidator
-from django.db.models import Q, CheckConstraint
-from django.db.models.functions import Upper
+from django.db.models import (
+    Case,
+    Count,
+    F,
+    IntegerField,
+    Max,
+    OuterRef,
+    Q,
+    Subquery,
+    Sum,
+    Value,
+    When,
+    CheckConstraint,
+)
+from django.db.models.functions import Coalesce, Lower, Upper
+from django.contrib.postgres.indexes import OpClass
 from .validators import (
     plate_validator,
     phone_validator,
@@ -17,6 +33,54 @@ from .validators import (
 )
 
 
+def _violated_constraint(error: IntegrityError) -> str | None:
+    """
+    Returns the name of the constraint a database IntegrityError reports, read from
+    the psycopg diagnostics rather than parsed out of the message. None if unknown.
+    """
+    return getattr(getattr(error.__cause__, "diag", None), "constraint_name", None)
+
+
+class CarrierQuerySet(models.QuerySet):
+    """
+    QuerySet for the Carrier model.
+
+    Methods:
+    - with_driver_count(): Annotates each carrier with `driver_count`.
+
+    Notes:
+    - The count is a correlated subquery rather than Count("drivers"), so annotated
+      querysets don't LEFT JOIN drivers and GROUP BY every Carrier column (including
+      in the paginator's COUNT).
+    """
+
+    def with_driver_count(self):
+        """
+        Annotates each carrier with `driver_count`, the number of its drivers (0 if none).
+
+        Returns:
+        - QuerySet of Carrier instances. `Carrier.available_drivers` reads the annotation.
+        """
+        drivers_per_carrier = (
+            Driver.objects.filter(carrier=OuterRef("pk"))
+            .order_by()
+            .values("carrier")
+            .annotate(count=Count("pk"))
+            .values("count")
+        )
+        return self.annotate(
+            driver_count=Coalesce(
+                Subquery(drivers_per_carrier, output_field=IntegerField()), 0
+            )
+        )
+
+
+class CarrierManager(models.Manager.from_queryset(CarrierQuerySet)):
+    """
+    Manager for the Carrier model, exposing the CarrierQuerySet methods.
+    """
+
+
 class Carrier(models.Model):
     """
     Represents a freight carrier in ReTrackLogistics.
@@ -34,12 +98,23 @@ class Carrier(models.Model):
         created_at / updated_at (datetime): Timestamps for record lifecycle.
 
     Properties:
-        available_drivers (int): Count of assigned drivers.
+        available_drivers (int): Count of assigned drivers. Uses the `driver_count`
+            annotation from `Carrier.objects.with_driver_count()` when present.
         capacity_status (str): Driver count label — Under, At, or Over Capacity.
 
     Methods:
-        clean(): Enforces uniqueness of normalized `mc_number`.
-        save(): Normalizes fields and triggers validation.
+        clean(): Validates `created_by_system`.
+        save(): Validates `created_by_system`, normalizes fields, and reports a duplicate
+            `mc_number` rejected by the database as a ValidationError. Field validation
+            (`full_clean()`) is left to admin forms and API serializers, so direct
+            `Carrier.objects.create()` calls don't run the field validators.
+
+    Constraints:
+        - `mc_number` is unique case-insensitively (UNIQUE index on UPPER(mc_number)), which
+            also backs the admin's exact MC number search.
+
+    Indexes:
+        - UPPER(name) with text_pattern_ops, for the admin's case-insensitive prefix search.
 
     Note:
         This model is raw-layer aware and can be extended with ingestion audit logs.
@@ -52,6 +127,8 @@ class Carrier(models.Model):
         "Legacy Migration": "LM_",
     }
 
+    objects = CarrierManager()
+
     name = models.CharField(max_length=255)
     mc_number = models.CharField(max_length=50, validators=[mc_number_validator])
     external_id = models.CharField(
@@ -86,12 +163,28 @@ class Carrier(models.Model):
 
     class Meta:
         ordering = ["name"]
+        indexes = [
+            # Serves UPPER(name) LIKE 'X%' (name__istartswith) with an index range scan
+            models.Index(
+                OpClass(Upper("name"), name="text_pattern_ops"),
+                name="carrier_name_upper_like_idx",
+            ),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                Upper("mc_number"),
+                name="unique_upper_mc_number",
+                violation_error_message="This MC number already exists.",
+            )
+        ]
 
     def __str__(self) -> str:
         return self.name
 
     def save(self, *args, **kwargs):
-        self.full_clean()  # Run validation first (calls `clean()`)
+        # Only the query-free `clean()`: external_id is derived from created_by_system.
+        # Forms and serializers run the full field/constraint validation upstream.
+        self.clean()
 
         if self.mc_number:
             self.mc_number = self.mc_number.upper().strip()
@@ -101,7 +194,17 @@ class Carrier(models.Model):
             prefix = self.__class__.CREATED_BY_SYSTEM_PREFIXES[self.created_by_system]
             self.external_id = f"{prefix}{uuid.uuid4().hex}"
 
-        super().save(*args, **kwargs)
+        # The savepoint keeps a surrounding transaction (admin, ATOMIC_REQUESTS) usable
+        # after a rejected insert, so the ValidationError can be reported
+        try:
+            with transaction.atomic():
+                super().save(*args, **kwargs)
+        except IntegrityError as e:
+            if _violated_constraint(e) != "unique_upper_mc_number":
+                raise
+            raise ValidationError(
+                {"mc_number": "This MC number already exists."}
+            ) from e
 
     def clean(self):
         super().clean()
@@ -116,27 +219,18 @@ class Carrier(models.Model):
                 }
             )
 
-        if self.mc_number:
-            # Normalize to match how the uniqueness constraint is enforced
-            normalized_mc_number = self.mc_number.upper().strip()
-
-            # Exclude self to avoid false positives during updates
-            existing = Carrier.objects.annotate(
-                normalized_mc_number=Upper("mc_number")
-            ).filter(normalized_mc_number=normalized_mc_number)
-
-            if self.pk:
-                existing = existing.exclude(pk=self.pk)
-
-            if existing.exists():
-                raise ValidationError({"mc_number": "This MC number already exists."})
-
     @property
     def available_drivers(self) -> int:
         """
         Returns the number of drivers linked to this carrier.
+
+        Reads the `driver_count` annotation added by `Carrier.objects.with_driver_count()`.
+        Without it, counts once and caches the result on the instance, so
+        `capacity_status` doesn't issue a second query.
         """
-        return self.drivers.count()
+        if not hasattr(self, "driver_count"):
+            self.driver_count = self.drivers.count()
+        return self.driver_count
 
     @property
     def capacity_status(
@@ -164,7 +258,7 @@ class CarrierContact(models.Model):
         carrier (Carrier): The carrier this contact is associated with.
         first_name (str): First name of the contact.
         last_name (str): Last name of the contact.
-        email (str): Unique email address for the contact. Enforced as lowercase.
+        email (str): Email address for the contact, unique case-insensitively. Stored in lowercase.
         phone_number (str or None): Optional US-formatted phone number (e.g., "832-123-4567").
         role (str): The contact's role within the carrier organization. One of: "Owner", "Dispatch", "Billing", "Safety".
         is_primary (bool): Indicates if this contact is the primary point of contact for the carrier.
@@ -173,11 +267,15 @@ class CarrierContact(models.Model):
 
     Constraints:
         - Only one primary contact (`is_primary=True`) is allowed per carrier.
-        - This is enforced at both the database level (via UniqueConstraint) and the application level (via `clean()`).
+        - This is enforced by the database (partial UniqueConstraint), which `full_clean()`
+          checks on forms that include `carrier`. `validate_constraints()` adds the same check
+          for forms without it (the admin changelist's `is_primary` edits), and `save()`
+          translates a violation of the index into a ValidationError.
+        - `email` is unique case-insensitively (UNIQUE index on LOWER(email)).
 
     Methods:
-        clean():
-            Validates that no other primary contact exists for the same carrier.
+        validate_constraints(exclude=None):
+            Also validates the primary contact rule when `carrier` is excluded.
 
         save(*args, **kwargs):
             Normalizes the phone number (removes dashes) and email (lowercased), then saves the instance.
@@ -194,7 +292,7 @@ class CarrierContact(models.Model):
     )
     first_name = models.CharField(max_length=255)
     last_name = models.CharField(max_length=255)
-    email = models.EmailField(unique=True)
+    email = models.EmailField()
     phone_number = models.CharField(
         max_length=12,
         validators=[phone_validator],
@@ -213,31 +311,56 @@ class CarrierContact(models.Model):
                 fields=["carrier"],
                 condition=models.Q(is_primary=True),
                 name="unique_primary_contact_per_carrier",
-            )
+                violation_error_message="This carrier already has a primary contact.",
+            ),
+            models.UniqueConstraint(
+                Lower("email"),
+                name="unique_lower_email_contact",
+                violation_error_message="A contact with this email already exists.",
+            ),
         ]
 
     def __str__(self) -> str:
         return f"{self.first_name} {self.last_name}"
 
-    def clean(self) -> None:
-        # Ensure no more than one primary contact per carrier at the form level
-        if self.is_primary:
-            existing = CarrierContact.objects.filter(
-                carrier=self.carrier, is_primary=True
-            )
-            if self.pk:
-                existing = existing.exclude(pk=self.pk)  # skip self during edit
-            if existing.exists():
-                raise ValidationError("This carrier already has a primary contact.")
+    def validate_constraints(self, exclude=None) -> None:
+        super().validate_constraints(exclude)
+        # full_clean() skips unique_primary_contact_per_carrier when `carrier` isn't on
+        # the form (the changelist's list_editable), so only then look for another
+        # primary contact directly. Forms with `carrier` rely on the constraint check.
+        if (
+            exclude
+            and "carrier" in exclude
+            and "is_primary" not in exclude
+            and self.is_primary
+            and self.carrier_id
+        ):
+            others = CarrierContact.objects.filter(
+                carrier_id=self.carrier_id, is_primary=True
+            ).exclude(pk=self.pk)
+            if others.exists():
+                raise ValidationError(
+                    {"is_primary": "This carrier already has a primary contact."}
+                )
 
     def save(self, *args, **kwargs) -> None:
         # Normalize phone number (strip dashes)
         if self.phone_number:
             self.phone_number = self.phone_number.replace("-", "")
-        # Normalize email to lowercase to enforce case-insensitive uniqueness
+        # Normalize email to lowercase; LOWER(email) uniqueness is enforced by the database
         if self.email:
             self.email = self.email.lower()
-        super().save(*args, **kwargs)
+        # One primary contact per carrier is enforced by the partial unique index;
+        # report a violation the same way model forms do
+        try:
+            with transaction.atomic():  # savepoint, see Carrier.save()
+                super().save(*args, **kwargs)
+        except IntegrityError as e:
+            if _violated_constraint(e) != "unique_primary_contact_per_carrier":
+                raise
+            raise ValidationError(
+                {"is_primary": "This carrier already has a primary contact."}
+            ) from e
 
 
 class Driver(models.Model):
@@ -248,7 +371,7 @@ class Driver(models.Model):
         first_name (str): First name of the driver.
         last_name (str): Last name of the driver.
         phone_number (str or None): Optional US-formatted phone number (e.g., "832-123-4567").
-        email (str): Unique email address for the driver. Stored in lowercase for case-insensitive uniqueness.
+        email (str): Email address for the driver, unique case-insensitively. Stored in lowercase.
         carrier (Carrier): The carrier this driver is associated with.
         created_at (datetime.datetime): Timestamp when the driver record was created.
         updated_at (datetime.datetime): Timestamp of the last update to the driver record.
@@ -256,6 +379,11 @@ class Driver(models.Model):
     Methods:
         save(*args, **kwargs):
             Normalizes the phone number (removes dashes) and email (lowercased), then saves the instance.
+
+    Meta:
+        indexes: UPPER(first_name) and UPPER(last_name) with text_pattern_ops, for the
+            admin's case-insensitive prefix search (also used by Shipment autocomplete).
+        constraints: `email` is unique case-insensitively (UNIQUE index on LOWER(email)).
     """
 
     first_name = models.CharField(max_length=255)
@@ -267,13 +395,32 @@ class Driver(models.Model):
         null=True,
         help_text="Format: 832-123-4567 or 8321234567",
     )
-    email = models.EmailField(unique=True)
+    email = models.EmailField()
     carrier = models.ForeignKey(
         Carrier, on_delete=models.PROTECT, related_name="drivers"
     )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            models.Index(
+                OpClass(Upper("first_name"), name="text_pattern_ops"),
+                name="driver_first_upper_like_idx",
+            ),
+            models.Index(
+                OpClass(Upper("last_name"), name="text_pattern_ops"),
+                name="driver_last_upper_like_idx",
+            ),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                Lower("email"),
+                name="unique_lower_email_driver",
+                violation_error_message="A driver with this email already exists.",
+            )
+        ]
+
     def __str__(self) -> str:
         return f"{self.first_name} {self.last_name}"
 
@@ -281,7 +428,7 @@ class Driver(models.Model):
         # Normalize phone number (strip dashes)
         if self.phone_number:
             self.phone_number = self.phone_number.replace("-", "")
-        # Normalize email to lowercase to enforce case-insensitive uniqueness
+        # Normalize email to lowercase; LOWER(email) uniqueness is enforced by the database
         if self.email:
             self.email = self.email.lower()
         super().save(*args, **kwargs)
@@ -331,36 +478,40 @@ class Asset(models.Model):
         name (str): The name or human-readable identifier of the asset.
         sku (str): A unique, case-insensitive stock-keeping unit. Normalized to uppercase on save.
         description (str): Optional detailed description of the asset.
-        slug (str): A unique, URL-friendly identifier auto-generated from `name` on create.
+        slug (str): A unique, URL-friendly identifier set once on create: the slugified `name`
+            plus a short hash of the SKU (e.g. "pallet-jack-1a2b3c4d").
         weight_lb (Decimal): Weight of a single unit in pounds. Must be greater than 0.
         length_in (Decimal): Length of the item in inches. Must be greater than 0.
         width_in (Decimal): Width of the item in inches. Must be greater than 0.
         height_in (Decimal): Height of the item in inches. Must be greater than 0.
         is_fragile (bool): Indicates whether the item is fragile and needs special handling.
         is_hazardous (bool): Indicates whether the item contains hazardous material.
+        volume_cubic_in (Decimal): Volume in cubic inches (L × W × H). A stored generated
+            column computed by the database, so it can be filtered and sorted on.
         created_at (datetime.datetime): Timestamp when the asset was created.
         updated_at (datetime.datetime): Timestamp of the most recent update to the asset.
 
     Properties:
-        volume_cubic_in (Decimal): Computed volume in cubic inches (L × W × H).
         needs_special_handling (bool): Returns `True` if the item is both fragile and hazardous.
 
     Methods:
-        clean():
-            Validates that the SKU is unique (case-insensitive) across all assets.
-
         save(*args, **kwargs):
-            Normalizes the SKU to uppercase, runs full validation, and saves the asset.
+            Normalizes the SKU to uppercase, fills in the slug on create and saves the
+            asset. Field validation (`full_clean()`) is left to admin forms and API serializers,
+            so direct `Asset.objects.create()` calls don't run the field validators.
+            A duplicate SKU rejected by the database is reported as a ValidationError.
+
+    Constraints:
+        - `sku` is unique case-insensitively (UNIQUE index on UPPER(sku)).
     """
 
     name = models.CharField(max_length=255)
     sku = models.CharField(max_length=64, validators=[sku_validator])
     description = models.TextField(blank=True)
-    slug = AutoSlugField(
-        populate_from="name",
+    slug = models.SlugField(
         unique=True,
-        always_update=False,  # set once on create
-        blank=True,  # allows omitting in forms/serializers
+        editable=False,  # generated in save(), set once on create
+        blank=True,
     )
     weight_lb = models.DecimalField(
         max_digits=7,
@@ -388,42 +539,43 @@ class Asset(models.Model):
     )
     is_fragile = models.BooleanField(default=False)
     is_hazardous = models.BooleanField(default=False)
+    volume_cubic_in = models.GeneratedField(
+        expression=F("length_in") * F("width_in") * F("height_in"),
+        # Exact product of three DecimalField(7, 2) values
+        output_field=models.DecimalField(max_digits=21, decimal_places=6),
+        db_persist=True,
+    )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
-        constraints = [models.UniqueConstraint(Upper("sku"), name="unique_upper_sku")]
+        constraints = [
+            models.UniqueConstraint(
+                Upper("sku"),
+                name="unique_upper_sku",
+                violation_error_message="This SKU already exists.",
+            )
+        ]
 
     def __str__(self) -> str:
         return self.name
 
     def save(self, *args, **kwargs):
-        self.full_clean()  # Triggers `clean()` before saving
         if self.sku:
             self.sku = self.sku.upper().strip()
-        super().save(*args, **kwargs)
-
-    def clean(self):
-        super().clean()
-
-        if self.sku:
-            # Normalize to match how the uniqueness constraint is enforced
-            normalized_sku = self.sku.upper().strip()
-
-            # Exclude self to avoid false positives during updates
-            existing = Asset.objects.annotate(normalized_sku=Upper("sku")).filter(
-                normalized_sku=normalized_sku
-            )
-
-            if self.pk:
-                existing = existing.exclude(pk=self.pk)
-
-            if existing.exists():
-                raise ValidationError({"sku": "This SKU already exists."})
-
-    @property
-    def volume_cubic_in(self) -> Decimal:
-        return self.length_in * self.width_in * self.height_in
+        if not self.slug:
+            # The SKU is unique, so hashing it makes the slug unique without probing
+            # the table for free "-2", "-3", ... suffixes
+            suffix = hashlib.blake2b(self.sku.encode(), digest_size=4).hexdigest()
+            base = slugify(self.name)[: self._meta.get_field("slug").max_length - 9]
+            self.slug = f"{base.rstrip('-')}-{suffix}" if base else suffix
+        try:
+            with transaction.atomic():  # savepoint, see Carrier.save()
+                super().save(*args, **kwargs)
+        except IntegrityError as e:
+            if _violated_constraint(e) != "unique_upper_sku":
+                raise
+            raise ValidationError({"sku": "This SKU already exists."}) from e
 
     @property
     def needs_special_handling(self) -> bool:
@@ -451,6 +603,7 @@ class ShipmentStatusEvent(models.Model):
     Constraints:
         - Each (shipment, status, event_timestamp) tuple must be unique.
         - Events are ordered chronologically by `event_timestamp`.
+        - Indexed on (shipment, -event_timestamp) for latest-event lookups.
 
     Methods:
         clean():
@@ -474,6 +627,9 @@ class ShipmentStatusEvent(models.Model):
         DELAYED = "delayed", "Delayed"
         CANCELLED = "cancelled", "Cancelled"
 
+    # get_status_display() rebuilds a dict from the field's choices on every call
+    _STATUS_LABELS = dict(Status.choices)
+
     shipment = models.ForeignKey(
         "Shipment", on_delete=models.CASCADE, related_name="status_events"
     )
@@ -501,40 +657,158 @@ class ShipmentStatusEvent(models.Model):
                 name="unique_status_event_per_timestamp",
             )
         ]
+        indexes = [
+            # Serves "latest event for a shipment" lookups with a backward index scan + LIMIT 1
+            models.Index(
+                fields=["shipment", "-event_timestamp"], name="sse_ship_ts_desc_idx"
+            ),
+        ]
         ordering = ["event_timestamp"]
 
     def __str__(self) -> str:
         ts = self.event_timestamp.strftime("%m/%d %H:%M")
-        return f"{self.get_status_display()} @ {ts} (Shipment #{self.shipment_id})"
+        label = self._STATUS_LABELS.get(self.status, self.status)
+        return f"{label} @ {ts} (Shipment #{self.shipment_id})"
 
     def clean(self) -> None:
-        # Chronological validation
-        latest_event = (
+        # One round-trip for both checks: the latest timestamp among the shipment's other
+        # events, and how many of them duplicate this (status, event_timestamp) pair.
+        stats = (
             ShipmentStatusEvent.objects.filter(shipment=self.shipment)
             .exclude(pk=self.pk)
-            .order_by("-event_timestamp")
-            .first()
+            .aggregate(
+                latest_timestamp=Max("event_timestamp"),
+                duplicates=Count(
+                    "pk",
+                    filter=Q(status=self.status, event_timestamp=self.event_timestamp),
+                ),
+            )
         )
-        if latest_event and latest_event.event_timestamp > self.event_timestamp:
+
+        # Chronological validation
+        if (
+            stats["latest_timestamp"]
+            and stats["latest_timestamp"] > self.event_timestamp
+        ):
             raise ValidationError(
                 "Cannot record an event earlier than the latest known status event."
             )
 
         # Duplicate check (customizes DB constraint error)
-        duplicate = (
-            ShipmentStatusEvent.objects.exclude(pk=self.pk)
-            .filter(
-                shipment=self.shipment,
-                status=self.status,
-                event_timestamp=self.event_timestamp,
+        if stats["duplicates"]:
+            raise ValidationError(
+                "This exact status event already exists — duplicate entries are not allowed."
             )
-            .exists()
+
+
+# Shipment timestamp stamped by the first event with each status, as (field, other_field,
+# comparison): the field is only stamped while other_field is empty or `other_field
+# <comparison> event_timestamp` holds, keeping shipment_actual_delivery_after_pickup.
+# The comparison is a lookup name for the UPDATE and maps to an operator for instances.
+_STATUS_TIMESTAMP_FIELDS = {
+    ShipmentStatusEvent.Status.IN_TRANSIT: ("actual_pickup", "actual_delivery", "gte"),
+    ShipmentStatusEvent.Status.DELIVERED: ("actual_delivery", "actual_pickup", "lte"),
+}
+_COMPARISON_OPERATORS = {"gte": operator.ge, "lte": operator.le}
+
+
+class ShipmentQuerySet(models.QuerySet):
+    """
+    QuerySet for the Shipment model.
+
+    Methods:
+    - with_related(): Joins the five forward foreign keys used when rendering shipments.
+    - apply_status_event(status, event_timestamp): Applies a status event to the
+      shipments in a single conditional UPDATE.
+    - recompute_current_status(): Resets the current status from the latest remaining
+      event in a single UPDATE.
+
+    Notes:
+    - Not applied by default: the API, signals and validation only read the FK ids, and
+      a default select_related would add five JOINs to every shipment query.
+    - Status events are not prefetched; `current_status` is denormalized onto the row.
+    """
+
+    def with_related(self):
+        """
+        Selects origin, destination, carrier, driver and vehicle in the same query, so
+        iterating the shipments and rendering `__str__` or the FK columns issues no
+        per-row lookups.
+
+        Returns:
+        - QuerySet of Shipment instances.
+        """
+        return self.select_related(
+            "origin", "destination", "carrier", "driver", "vehicle"
         )
 
-        if duplicate:
-            raise ValidationError(
-                "This exact status event already exists — duplicate entries are not allowed."
+    def apply_status_event(self, status, event_timestamp) -> int:
+        """
+        Applies a status event to every shipment in the queryset with one UPDATE, without
+        loading the rows:
+        - `current_status` / `current_status_at` take the event's values only where the
+          event is at least as recent as the stored one, so events recorded out of order
+          don't overwrite a newer status.
+        - `actual_pickup` / `actual_delivery` are set from an In Transit / Delivered
+          event where still empty, unless that would put pickup after delivery (e.g. an
+          In Transit event recorded after the shipment was delivered).
+
+        Returns:
+        - The number of shipments updated.
+        """
+        is_latest = Q(current_status_at__isnull=True) | Q(
+            current_status_at__lte=event_timestamp
+        )
+        fields = {
+            "current_status": Case(
+                When(is_latest, then=Value(status)),
+                default=F("current_status"),
+            ),
+            "current_status_at": Case(
+                When(is_latest, then=Value(event_timestamp)),
+                default=F("current_status_at"),
+            ),
+            "updated_at": timezone.now(),
+        }
+        if status in _STATUS_TIMESTAMP_FIELDS:
+            timestamp_field, other_field, comparison = _STATUS_TIMESTAMP_FIELDS[status]
+            stamp = Q(**{f"{timestamp_field}__isnull": True}) & (
+                Q(**{f"{other_field}__isnull": True})
+                | Q(**{f"{other_field}__{comparison}": event_timestamp})
+            )
+            fields[timestamp_field] = Case(
+                When(stamp, then=Value(event_timestamp)),
+                default=F(timestamp_field),
             )
+        return self.update(**fields)
+
+    def recompute_current_status(self) -> int:
+        """
+        Re-reads `current_status` / `current_status_at` from each shipment's latest
+        remaining event with one UPDATE, falling back to Pending when there are none.
+        Used when an event is edited or deleted, where the change can move the status
+        backwards.
+
+        Returns:
+        - The number of shipments updated.
+        """
+        latest_event = ShipmentStatusEvent.objects.filter(
+            shipment=OuterRef("pk")
+        ).order_by("-event_timestamp")
+        return self.update(
+            current_status=Coalesce(
+                Subquery(latest_event.values("status")[:1]),
+                Value(ShipmentStatusEvent.Status.PENDING),
+            ),
+            current_status_at=Subquery(latest_event.values("event_timestamp")[:1]),
+            updated_at=timezone.now(),
+        )
+
+
+class ShipmentManager(models.Manager.from_queryset(ShipmentQuerySet)):
+    """
+    Manager for the Shipment model, exposing the ShipmentQuerySet methods.
+    """
 
 
 class Shipment(models.Model):
@@ -551,13 +825,14 @@ class Shipment(models.Model):
         carrier (Carrier or None): The carrier assigned to fulfill the shipment.
         driver (Driver or None): The driver assigned to handle the shipment.
         vehicle (Vehicle or None): The vehicle assigned to transport the shipment.
+        current_status (str): The most recent status of the shipment. Denormalized from the
+            latest ShipmentStatusEvent and kept in sync by the signals in `signals.py`.
+            Defaults to "Pending" if no events exist.
+        current_status_at (datetime.datetime or None): Timestamp of the event `current_status` was
+            copied from. Used to ignore events recorded out of order. None if no events exist.
         created_at (datetime.datetime): Timestamp when the shipment record was created.
         updated_at (datetime.datetime): Timestamp of the most recent update to the shipment.
 
-    Properties:
-        current_status (str): The most recent status of the shipment, derived from related status events.
-            Defaults to "Pending" if no events exist.
-
     Methods:
         clean():
             Validates business rules:
@@ -568,12 +843,31 @@ class Shipment(models.Model):
 
         record_status_event(new_status, source=None, event_timestamp=None) -> ShipmentStatusEvent:
             Creates a new status event for the shipment and updates actual pickup/delivery timestamps
-            if applicable (e.g., sets actual_pickup on first In Transit event).
+            if applicable (e.g., sets actual_pickup on first In Transit event). The shipment row is
+            updated by the ShipmentStatusEvent post_save receiver in a single UPDATE, in the same
+            transaction as the event insert.
+
+        bulk_record_status_events(events, source=None, batch_size=1000) -> list[ShipmentStatusEvent]:
+            Records many (shipment_id, status, event_timestamp) events with one bulk INSERT and
+            one bulk UPDATE of the affected shipments, applying the same rules.
+
+        total_weight() -> Decimal:
+            Returns the combined weight of the shipment's items, summed by the database.
+
+    Managers:
+        objects (ShipmentManager): Adds `with_related()` for views that render related objects.
 
     Meta:
         ordering: Shipments are ordered by scheduled pickup time (ascending).
+        indexes: (driver, current_status) for delivered counts per driver,
+            (carrier, scheduled_pickup) for per-carrier listings in pickup order,
+            scheduled_pickup for the default ordering, and current_status for the
+            status filter.
+        constraints: delivery dates not before pickup dates, and origin != destination.
     """
 
+    objects = ShipmentManager()
+
     scheduled_pickup = models.DateTimeField()
     scheduled_delivery = models.DateTimeField()
     actual_pickup = models.DateTimeField(null=True, blank=True)
@@ -601,21 +895,63 @@ class Shipment(models.Model):
     vehicle = models.ForeignKey(
         "Vehicle", on_delete=models.SET_NULL, null=True, blank=True
     )
+    current_status = models.CharField(
+        max_length=20,
+        choices=ShipmentStatusEvent.Status.choices,
+        default=ShipmentStatusEvent.Status.PENDING,
+        editable=False,
+        help_text="Latest status event for this shipment (maintained automatically).",
+    )
+    current_status_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        editable=False,
+        help_text="Timestamp of the latest status event (maintained automatically).",
+    )
 
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         ordering = ["scheduled_pickup"]
-
-    @property
-    def current_status(
-        self,
-    ):
-        latest_event = self.status_events.order_by("-event_timestamp").first()
-        return (
-            latest_event.status if latest_event else ShipmentStatusEvent.Status.PENDING
-        )
+        indexes = [
+            # Supports per-driver counts of delivered shipments (DriverAdmin)
+            models.Index(
+                fields=["driver", "current_status"], name="shipment_driver_status_idx"
+            ),
+            # Serves per-carrier listings in the default scheduled_pickup order
+            models.Index(
+                fields=["carrier", "scheduled_pickup"],
+                name="shipment_carrier_pickup_idx",
+            ),
+            # Serves the unfiltered default ordering (admin changelist pages) and
+            # pickup time-window filters across all carriers
+            models.Index(fields=["scheduled_pickup"], name="shipment_pickup_idx"),
+            # Serves the changelist's current_status filter
+            models.Index(fields=["current_status"], name="shipment_status_idx"),
+        ]
+        # Enforce the date and location rules from clean() for writes that skip it
+        # (API updates, bulk_update, the status signals). clean() keeps the same
+        # checks so forms report them per field.
+        constraints = [
+            CheckConstraint(
+                condition=Q(scheduled_delivery__gte=F("scheduled_pickup")),
+                name="shipment_scheduled_delivery_after_pickup",
+                violation_error_message="Scheduled delivery cannot be before scheduled pickup.",
+            ),
+            CheckConstraint(
+                condition=Q(actual_pickup__isnull=True)
+                | Q(actual_delivery__isnull=True)
+                | Q(actual_delivery__gte=F("actual_pickup")),
+                name="shipment_actual_delivery_after_pickup",
+                violation_error_message="Actual delivery cannot be before actual pickup.",
+            ),
+            CheckConstraint(
+                condition=~Q(origin=F("destination")),
+                name="shipment_origin_not_destination",
+                violation_error_message="Origin and destination cannot be the same.",
+            ),
+        ]
 
     def __str__(self) -> str:
         return f"{self.origin} → {self.destination}"
@@ -645,15 +981,15 @@ class Shipment(models.Model):
                 )
 
         # 3. Ensure driver belongs to carrier (if both are assigned)
-        if self.carrier and self.driver:
-            if self.driver.carrier_id != self.carrier_id:
+        if self.carrier_id and self.driver_id:
+            if self._related_carrier_id("driver") != self.carrier_id:
                 errors["driver"] = (
                     "Selected driver does not belong to the assigned carrier."
                 )
 
         # 4. Ensure vehicle belongs to carrier (if both are assigned)
-        if self.carrier and self.vehicle:
-            if self.vehicle.carrier_id != self.carrier_id:
+        if self.carrier_id and self.vehicle_id:
+            if self._related_carrier_id("vehicle") != self.carrier_id:
                 errors["vehicle"] = (
                     "Selected vehicle does not belong to the assigned carrier."
                 )
@@ -666,34 +1002,167 @@ class Shipment(models.Model):
         if errors:
             raise ValidationError(errors)
 
+    def _related_carrier_id(self, field_name) -> int | None:
+        """
+        Returns the carrier_id of the assigned Driver or Vehicle (`field_name`).
+
+        Reuses the related instance when it's already loaded (e.g. by a form);
+        otherwise fetches only its carrier_id column instead of the full row.
+        """
+        field = self._meta.get_field(field_name)
+        if field.is_cached(self):
+            return getattr(self, field_name).carrier_id
+
+        return (
+            field.related_model.objects.filter(pk=getattr(self, field.attname))
+            .values_list("carrier_id", flat=True)
+            .first()
+        )
+
+    def total_weight(self) -> Decimal:
+        """
+        Returns the combined weight (in pounds) of this shipment's items.
+        """
+        return self.items.total_weight()
+
     def record_status_event(
         self, new_status, source=None, event_timestamp=None
     ) -> ShipmentStatusEvent:
-        event = ShipmentStatusEvent.objects.create(
-            shipment=self,
-            status=new_status,
-            event_timestamp=event_timestamp or timezone.now(),
-            source=source,
-        )
+        # The post_save receiver (signals.sync_current_status_on_save) applies the event to
+        # this shipment's row in one UPDATE (ShipmentQuerySet.apply_status_event):
+        # current_status/current_status_at plus actual_pickup/actual_delivery. The atomic block keeps the insert and that UPDATE
+        # together.
+        with transaction.atomic():
+            event = ShipmentStatusEvent.objects.create(
+                shipment=self,
+                status=new_status,
+                event_timestamp=event_timestamp or timezone.now(),
+                source=source,
+            )
 
-        # TODO: align data from ShipmentStatusEvent and Shipment tables to follow these constraints
-        # actual_pickup from Shipement model should be the same value as event_timestamp for status IN_TRANSIT
-        # actual_delivery from Shipement model should be the same value as event_timestamp for status DELIVERED
+        # Mirror the database changes on this instance so callers see a consistent object
+        self._apply_status_event(event.status, event.event_timestamp)
 
-        if (
-            new_status == ShipmentStatusEvent.Status.IN_TRANSIT
-            and not self.actual_pickup
-        ):
-            self.actual_pickup = event.event_timestamp
+        return event
 
-        if (
-            new_status == ShipmentStatusEvent.Status.DELIVERED
-            and not self.actual_delivery
-        ):
-            self.actual_delivery = event.event_timestamp
+    @classmethod
+    def bulk_record_status_events(
+        cls, events, source=None, batch_size=1000
+    ) -> list[ShipmentStatusEvent]:
+        """
+        Records many status events at once, e.g. from a webhook or import batch.
 
-        self.save(update_fields=["actual_pickup", "actual_delivery", "updated_at"])
-        return event
+        Args:
+            events: Iterable of (shipment_id, status, event_timestamp) tuples, applied in
+                order. A None timestamp means "now".
+            source (str or None): Recorded on every event.
+            batch_size (int): Rows per INSERT/UPDATE statement.
+
+        Returns:
+            The created ShipmentStatusEvent instances.
+
+        Raises:
+            Shipment.DoesNotExist: If any shipment_id doesn't exist. Nothing is recorded.
+
+        Notes:
+            bulk_create() doesn't send post_save, so the shipments are updated here with
+            the same rules as `record_status_event()`: one INSERT and one UPDATE per batch
+            instead of two queries per event.
+        """
+        now = timezone.now()
+        new_events = [
+            ShipmentStatusEvent(
+                shipment_id=shipment_id,
+                status=status,
+                event_timestamp=event_timestamp or now,
+                source=source,
+            )
+            for shipment_id, status, event_timestamp in events
+        ]
+        if not new_events:
+            return []
+
+        fields = [
+            "current_status",
+            "current_status_at",
+            "actual_pickup",
+            "actual_delivery",
+        ]
+        with transaction.atomic():
+            # Lock the rows so concurrent record_status_event() calls can't interleave
+            shipments = (
+                cls.objects.select_for_update()
+                .only(*fields)
+                .in_bulk({event.shipment_id for event in new_events})
+            )
+            missing = {event.shipment_id for event in new_events} - shipments.keys()
+            if missing:
+                raise cls.DoesNotExist(f"Shipments not found: {sorted(missing)}")
+
+            ShipmentStatusEvent.objects.bulk_create(new_events, batch_size=batch_size)
+
+            for event in new_events:
+                shipments[event.shipment_id]._apply_status_event(
+                    event.status, event.event_timestamp
+                )
+            for shipment in shipments.values():
+                shipment.updated_at = now  # bulk_update() skips auto_now
+            cls.objects.bulk_update(
+                shipments.values(), [*fields, "updated_at"], batch_size=batch_size
+            )
+
+        return new_events
+
+    def _apply_status_event(self, status, event_timestamp) -> None:
+        """
+        Applies a status event to this instance's fields, following the same rules the
+        post_save receiver applies to the row: the first In Transit/Delivered event sets
+        actual_pickup/actual_delivery (unless it would put pickup after delivery), and only
+        the latest event sets the current status.
+        """
+        if status in _STATUS_TIMESTAMP_FIELDS:
+            timestamp_field, other_field, comparison = _STATUS_TIMESTAMP_FIELDS[status]
+            other = getattr(self, other_field)
+            if getattr(self, timestamp_field) is None and (
+                other is None
+                or _COMPARISON_OPERATORS[comparison](other, event_timestamp)
+            ):
+                setattr(self, timestamp_field, event_timestamp)
+
+        if self.current_status_at is None or event_timestamp >= self.current_status_at:
+            self.current_status = status
+            self.current_status_at = event_timestamp
+
+
+class ShipmentItemQuerySet(models.QuerySet):
+    """
+    QuerySet for the ShipmentItem model.
+
+    Methods:
+    - total_weight(): Sums quantity × unit_weight_lb over the items in the database.
+    """
+
+    def total_weight(self) -> Decimal:
+        """
+        Returns the combined weight of the items in pounds, computed in a single
+        aggregate query. Items without a recorded unit weight are ignored.
+
+        Returns:
+        - Decimal total, or Decimal("0") if there are no items.
+        """
+        total = self.aggregate(
+            total=Sum(
+                F("quantity") * F("unit_weight_lb"),
+                output_field=models.DecimalField(max_digits=19, decimal_places=2),
+            )
+        )["total"]
+        return total or Decimal("0")
+
+
+class ShipmentItemManager(models.Manager.from_queryset(ShipmentItemQuerySet)):
+    """
+    Manager for the ShipmentItem model, exposing the ShipmentItemQuerySet methods.
+    """
 
 
 class ShipmentItem(models.Model):
@@ -712,6 +1181,8 @@ class ShipmentItem(models.Model):
 
     Properties:
         total_weight (Decimal): Computed total weight (quantity × unit_weight_lb).
+            Use `ShipmentItem.objects.total_weight()` (or `Shipment.total_weight()`) to
+            sum it over many items in the database.
 
     Methods:
         clean():
@@ -722,11 +1193,16 @@ class ShipmentItem(models.Model):
         save(*args, **kwargs):
             Automatically snapshots the asset's current weight into `unit_weight_lb` if not already set.
 
+        bulk_create_with_weights(items, batch_size=1000) -> list[ShipmentItem]:
+            Bulk-inserts items, snapshotting missing unit weights with one Asset query.
+
     Notes:
         This model stores a denormalized unit weight to preserve historical accuracy,
         even if the asset definition changes after the shipment is recorded.
     """
 
+    objects = ShipmentItemManager()
+
     shipment = models.ForeignKey(
         "Shipment", on_delete=models.CASCADE, related_name="items"
     )
@@ -756,11 +1232,39 @@ class ShipmentItem(models.Model):
         return self.asset.name
 
     def save(self, *args, **kwargs):
-        # Only snapshot the asset's weight if unit_weight_lb is not already set
-        if self.asset and self.unit_weight_lb in [None, 0]:
+        # Only snapshot the asset's weight if unit_weight_lb is not already set. Checked
+        # before touching self.asset so items with a weight don't load their asset.
+        if self.unit_weight_lb in [None, 0] and self.asset_id:
             self.unit_weight_lb = self.asset.weight_lb
         super().save(*args, **kwargs)
 
+    @classmethod
+    def bulk_create_with_weights(cls, items, batch_size=1000) -> list["ShipmentItem"]:
+        """
+        Inserts many shipment items at once, snapshotting asset weights like `save()`.
+
+        The weights of all referenced assets are read in one query instead of one
+        Asset lookup per item, then the items are written with bulk_create().
+
+        Args:
+            items: Unsaved ShipmentItem instances.
+            batch_size (int): Rows per INSERT statement.
+
+        Returns:
+            The created ShipmentItem instances.
+        """
+        items = list(items)
+        missing = [item for item in items if item.unit_weight_lb in [None, 0]]
+        if missing:
+            weights = dict(
+                Asset.objects.filter(
+                    pk__in={item.asset_id for item in missing}
+                ).values_list("pk", "weight_lb")
+            )
+            for item in missing:
+                item.unit_weight_lb = weights.get(item.asset_id)
+        return cls.objects.bulk_create(items, batch_size=batch_size)
+
     def clean(self):
         """
         Additional validation beyond field-level checks.
@@ -1,5 +1,5 @@
 from rest_framework import serializers
-from django.db.models.functions import Upper
+from django.db.models.functions import Lower, Upper
 from .models import (
     Carrier,
     CarrierContact,
@@ -75,6 +75,28 @@ class CarrierContactSerializer(serializers.ModelSerializer):
 
         return attrs
 
+    def validate_email(self, value):
+        """
+        Ensure email is unique (case-insensitive) and normalized to lowercase.
+        """
+        normalized = value.lower()
+
+        # Compared through LOWER() so the lookup uses the unique_lower_email_contact index
+        qs = CarrierContact.objects.annotate(norm_email=Lower("email")).filter(
+            norm_email=normalized
+        )
+
+        # Exclude the current instance during updates
+        if self.instance:
+            qs = qs.exclude(pk=self.instance.pk)
+
+        if qs.exists():
+            raise serializers.ValidationError(
+                "A contact with this email already exists."
+            )
+
+        return normalized
+
 
 class SimpleCarrierContactSerializer(serializers.ModelSerializer):
     class Meta:
@@ -144,6 +166,28 @@ class DriverSerializer(serializers.ModelSerializer):
             "updated_at",
         ]
 
+    def validate_email(self, value):
+        """
+        Ensure email is unique (case-insensitive) and normalized to lowercase.
+        """
+        normalized = value.lower()
+
+        # Compared through LOWER() so the lookup uses the unique_lower_email_driver index
+        qs = Driver.objects.annotate(norm_email=Lower("email")).filter(
+            norm_email=normalized
+        )
+
+        # Exclude the current instance during updates
+        if self.instance:
+            qs = qs.exclude(pk=self.instance.pk)
+
+        if qs.exists():
+            raise serializers.ValidationError(
+                "A driver with this email already exists."
+            )
+
+        return normalized
+
 
 class VehicleSerializer(serializers.ModelSerializer):
     """
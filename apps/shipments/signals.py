@@ -0,0 +1,49 @@
+from django.db.models import QuerySet
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from .models import Shipment, ShipmentStatusEvent
+
+
+@receiver(post_save, sender=ShipmentStatusEvent)
+def sync_current_status_on_save(sender, instance, created, raw=False, **kwargs) -> None:
+    """
+    Keeps the event's Shipment in sync with a single UPDATE.
+
+    New events are applied with `ShipmentQuerySet.apply_status_event()`:
+    - Copies the event's status onto `Shipment.current_status` so list views and
+      filters can read a plain column instead of looking up the latest event per row.
+      Only applies when the event is at least as recent as the stored one, so events
+      recorded out of order don't overwrite a newer status.
+    - Sets `actual_pickup` / `actual_delivery` from the first In Transit / Delivered
+      event, leaving existing values untouched.
+
+    An edited event can change which event is the latest (or move it back in time), so
+    the current status is recomputed from the shipment's events instead.
+
+    Skipped for fixture loads (`raw`), which already carry the shipment's stored values.
+    """
+    if raw:
+        return
+
+    shipments = Shipment.objects.filter(pk=instance.shipment_id)
+    if created:
+        shipments.apply_status_event(instance.status, instance.event_timestamp)
+    else:
+        shipments.recompute_current_status()
+
+
+@receiver(post_delete, sender=ShipmentStatusEvent)
+def sync_current_status_on_delete(sender, instance, origin=None, **kwargs) -> None:
+    """
+    Recomputes `Shipment.current_status` from the remaining events after one is removed,
+    in a single UPDATE. Falls back to Pending when the shipment has no events left.
+
+    Skipped when the events are being cascaded from a deleted Shipment (or Shipment
+    queryset), since there is no row left to update.
+    """
+    if isinstance(origin, Shipment) or (
+        isinstance(origin, QuerySet) and origin.model is Shipment
+    ):
+        return
+
+    Shipment.objects.filter(pk=instance.shipment_id).recompute_current_status()
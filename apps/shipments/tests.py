@@ -1,3 +1,303 @@
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+from django.core import serializers
 from django.test import TestCase
 
-# Create your tests here.
+from apps.locations.models import Location
+from .models import Shipment, ShipmentStatusEvent
+
+Status = ShipmentStatusEvent.Status
+
+T0 = datetime(2025, 6, 1, tzinfo=dt_timezone.utc)
+
+
+def at(hours) -> datetime:
+    return T0 + timedelta(hours=hours)
+
+
+class ShipmentStatusTestCase(TestCase):
+    """
+    Base fixture: two locations and a helper to create pending shipments between them.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.origin = Location.objects.create(
+            name="Houston DC",
+            address_line1="1 Main St",
+            city="Houston",
+            state="TX",
+            postal_code="77001",
+        )
+        cls.destination = Location.objects.create(
+            name="Dallas DC",
+            address_line1="2 Elm St",
+            city="Dallas",
+            state="TX",
+            postal_code="75201",
+        )
+
+    def make_shipment(self) -> Shipment:
+        return Shipment.objects.create(
+            origin=self.origin,
+            destination=self.destination,
+            scheduled_pickup=T0,
+            scheduled_delivery=at(24),
+        )
+
+    def add_event(self, shipment, status, hours) -> ShipmentStatusEvent:
+        # Created directly (not through record_status_event) to exercise the receivers
+        return ShipmentStatusEvent.objects.create(
+            shipment=shipment, status=status, event_timestamp=at(hours)
+        )
+
+    def assertShipmentState(self, shipment, status, status_at, pickup, delivery):
+        shipment.refresh_from_db()
+        self.assertEqual(
+            (
+                shipment.current_status,
+                shipment.current_status_at,
+                shipment.actual_pickup,
+                shipment.actual_delivery,
+            ),
+            (status, status_at, pickup, delivery),
+        )
+
+
+class StatusEventSaveReceiverTests(ShipmentStatusTestCase):
+    def test_new_shipment_is_pending(self):
+        shipment = self.make_shipment()
+        self.assertShipmentState(shipment, Status.PENDING, None, None, None)
+
+    def test_events_in_order(self):
+        shipment = self.make_shipment()
+        self.add_event(shipment, Status.IN_TRANSIT, 1)
+        self.assertShipmentState(shipment, Status.IN_TRANSIT, at(1), at(1), None)
+
+        self.add_event(shipment, Status.DELIVERED, 5)
+        self.assertShipmentState(shipment, Status.DELIVERED, at(5), at(1), at(5))
+
+    def test_later_events_keep_first_actual_timestamps(self):
+        shipment = self.make_shipment()
+        self.add_event(shipment, Status.IN_TRANSIT, 1)
+        self.add_event(shipment, Status.DELAYED, 2)
+        self.add_event(shipment, Status.IN_TRANSIT, 3)
+        self.assertShipmentState(shipment, Status.IN_TRANSIT, at(3), at(1), None)
+
+    def test_older_event_does_not_overwrite_newer_status(self):
+        shipment = self.make_shipment()
+        self.add_event(shipment, Status.DELIVERED, 5)
+        self.add_event(shipment, Status.IN_TRANSIT, 1)
+        # The late In Transit event still fills actual_pickup (1 <= 5)
+        self.assertShipmentState(shipment, Status.DELIVERED, at(5), at(1), at(5))
+
+    def test_in_transit_after_delivery_does_not_stamp_pickup(self):
+        shipment = self.make_shipment()
+        self.add_event(shipment, Status.DELIVERED, 5)
+        # Stamping actual_pickup=6 would break shipment_actual_delivery_after_pickup
+        self.add_event(shipment, Status.IN_TRANSIT, 6)
+        self.assertShipmentState(shipment, Status.IN_TRANSIT, at(6), None, at(5))
+
+    def test_delivered_before_pickup_does_not_stamp_delivery(self):
+        shipment = self.make_shipment()
+        self.add_event(shipment, Status.IN_TRANSIT, 5)
+        self.add_event(shipment, Status.DELIVERED, 1)
+        self.assertShipmentState(shipment, Status.IN_TRANSIT, at(5), at(5), None)
+
+    def test_edited_event_recomputes_current_status(self):
+        shipment = self.make_shipment()
+        self.add_event(shipment, Status.IN_TRANSIT, 1)
+        event = self.add_event(shipment, Status.DELIVERED, 5)
+
+        event.status = Status.DELAYED
+        event.event_timestamp = T0 + timedelta(minutes=30)
+        event.save()
+
+        # actual_pickup/actual_delivery are first-event stamps and are left as recorded
+        self.assertShipmentState(shipment, Status.IN_TRANSIT, at(1), at(1), at(5))
+
+    def test_edited_event_moved_later_becomes_current(self):
+        shipment = self.make_shipment()
+        event = self.add_event(shipment, Status.IN_TRANSIT, 1)
+        self.add_event(shipment, Status.DELAYED, 2)
+
+        event.event_timestamp = at(3)
+        event.save()
+
+        self.assertShipmentState(shipment, Status.IN_TRANSIT, at(3), at(1), None)
+
+    def test_raw_save_does_not_touch_shipment(self):
+        shipment = self.make_shipment()
+        event = self.add_event(shipment, Status.IN_TRANSIT, 1)
+        data = serializers.serialize("json", [event])
+        Shipment.objects.filter(pk=shipment.pk).update(
+            current_status=Status.CANCELLED, current_status_at=at(9)
+        )
+
+        for obj in serializers.deserialize("json", data):
+            obj.save()  # what loaddata does, with raw=True
+
+        self.assertShipmentState(shipment, Status.CANCELLED, at(9), at(1), None)
+
+
+class StatusEventDeleteReceiverTests(ShipmentStatusTestCase):
+    def test_deleting_latest_event_restores_previous_status(self):
+        shipment = self.make_shipment()
+        self.add_event(shipment, Status.IN_TRANSIT, 1)
+        event = self.add_event(shipment, Status.DELAYED, 2)
+
+        event.delete()
+
+        self.assertShipmentState(shipment, Status.IN_TRANSIT, at(1), at(1), None)
+
+    def test_deleting_older_event_keeps_current_status(self):
+        shipment = self.make_shipment()
+        event = self.add_event(shipment, Status.IN_TRANSIT, 1)
+        self.add_event(shipment, Status.DELAYED, 2)
+
+        event.delete()
+
+        self.assertShipmentState(shipment, Status.DELAYED, at(2), at(1), None)
+
+    def test_deleting_all_events_falls_back_to_pending(self):
+        shipment = self.make_shipment()
+        self.add_event(shipment, Status.IN_TRANSIT, 1)
+        self.add_event(shipment, Status.DELAYED, 2)
+
+        shipment.status_events.all().delete()
+
+        self.assertShipmentState(shipment, Status.PENDING, None, at(1), None)
+
+    def test_deleting_shipment_skips_per_event_updates(self):
+        shipment = self.make_shipment()
+        for hours in range(10):
+            self.add_event(shipment, Status.DELAYED, hours)
+
+        # SELECT events, DELETE items, detach GPS events, DELETE events, DELETE
+        # shipment; no per-event current_status UPDATE for the cascaded events.
+        with self.assertNumQueries(5):
+            shipment.delete()
+
+        self.assertFalse(ShipmentStatusEvent.objects.exists())
+
+    def test_deleting_shipment_queryset_cascades(self):
+        shipments = [self.make_shipment(), self.make_shipment()]
+        for shipment in shipments:
+            self.add_event(shipment, Status.IN_TRANSIT, 1)
+        kept = self.make_shipment()
+        self.add_event(kept, Status.DELAYED, 2)
+
+        Shipment.objects.filter(pk__in=[s.pk for s in shipments]).delete()
+
+        self.assertEqual(ShipmentStatusEvent.objects.count(), 1)
+        self.assertShipmentState(kept, Status.DELAYED, at(2), None, None)
+
+
+class ApplyStatusEventTests(ShipmentStatusTestCase):
+    def test_updates_every_shipment_in_one_query(self):
+        first, second = self.make_shipment(), self.make_shipment()
+        ShipmentStatusEvent.objects.create(
+            shipment=second, status=Status.DELIVERED, event_timestamp=at(5)
+        )
+
+        with self.assertNumQueries(1):
+            updated = Shipment.objects.filter(
+                pk__in=[first.pk, second.pk]
+            ).apply_status_event(Status.IN_TRANSIT, at(3))
+
+        self.assertEqual(updated, 2)
+        self.assertShipmentState(first, Status.IN_TRANSIT, at(3), at(3), None)
+        # Older than the stored status; pickup at 3 is before delivery at 5
+        self.assertShipmentState(second, Status.DELIVERED, at(5), at(3), at(5))
+
+    def test_recompute_current_status(self):
+        shipment = self.make_shipment()
+        self.add_event(shipment, Status.IN_TRANSIT, 1)
+        Shipment.objects.filter(pk=shipment.pk).update(
+            current_status=Status.CANCELLED, current_status_at=at(9)
+        )
+
+        with self.assertNumQueries(1):
+            Shipment.objects.filter(pk=shipment.pk).recompute_current_status()
+
+        self.assertShipmentState(shipment, Status.IN_TRANSIT, at(1), at(1), None)
+
+
+class RecordStatusEventTests(ShipmentStatusTestCase):
+    def test_instance_matches_database(self):
+        shipment = self.make_shipment()
+        shipment.record_status_event(Status.DELIVERED, event_timestamp=at(5))
+        shipment.record_status_event(Status.IN_TRANSIT, event_timestamp=at(6))
+
+        fields = ["current_status", "current_status_at", "actual_pickup"]
+        in_memory = [getattr(shipment, f) for f in fields + ["actual_delivery"]]
+        shipment.refresh_from_db()
+        self.assertEqual(
+            in_memory, [getattr(shipment, f) for f in fields + ["actual_delivery"]]
+        )
+        self.assertEqual(in_memory, [Status.IN_TRANSIT, at(6), None, at(5)])
+
+
+class BulkRecordStatusEventsTests(ShipmentStatusTestCase):
+    EVENTS = [
+        (0, Status.IN_TRANSIT, 1),
+        (1, Status.DELIVERED, 5),
+        (0, Status.DELIVERED, 4),
+        (1, Status.IN_TRANSIT, 6),  # after delivery: no actual_pickup
+        (0, Status.DELAYED, 2),  # out of order: status stays delivered
+    ]
+
+    def shipment_rows(self, shipments):
+        return list(
+            Shipment.objects.filter(pk__in=[s.pk for s in shipments])
+            .order_by("pk")
+            .values_list(
+                "current_status",
+                "current_status_at",
+                "actual_pickup",
+                "actual_delivery",
+            )
+        )
+
+    def test_matches_sequential_recording(self):
+        bulk = [self.make_shipment(), self.make_shipment()]
+        sequential = [self.make_shipment(), self.make_shipment()]
+
+        created = Shipment.bulk_record_status_events(
+            [(bulk[i].pk, status, at(h)) for i, status, h in self.EVENTS],
+            source="import",
+        )
+        for i, status, h in self.EVENTS:
+            sequential[i].record_status_event(status, event_timestamp=at(h))
+
+        self.assertEqual(len(created), len(self.EVENTS))
+        self.assertEqual(self.shipment_rows(bulk), self.shipment_rows(sequential))
+        self.assertEqual(
+            self.shipment_rows(bulk),
+            [
+                (Status.DELIVERED, at(4), at(1), at(4)),
+                (Status.IN_TRANSIT, at(6), None, at(5)),
+            ],
+        )
+        self.assertEqual(
+            ShipmentStatusEvent.objects.filter(source="import").count(),
+            len(self.EVENTS),
+        )
+
+    def test_missing_shipment_records_nothing(self):
+        shipment = self.make_shipment()
+
+        with self.assertRaises(Shipment.DoesNotExist):
+            Shipment.bulk_record_status_events(
+                [
+                    (shipment.pk, Status.IN_TRANSIT, at(1)),
+                    (shipment.pk + 1000, Status.IN_TRANSIT, at(1)),
+                ]
+            )
+
+        self.assertFalse(ShipmentStatusEvent.objects.exists())
+        self.assertShipmentState(shipment, Status.PENDING, None, None, None)
+
+    def test_empty_batch(self):
+        with self.assertNumQueries(0):
+            self.assertEqual(Shipment.bulk_record_status_events([]), [])
@@ -82,7 +82,8 @@ class DriverViewSet(ModelViewSet):
     Provides list, create, retrieve, update, and delete operations.
     """
 
-    queryset = Driver.objects.all().select_related("carrier").order_by("id")
+    # DriverSerializer renders `carrier` as a primary key, so no join is needed
+    queryset = Driver.objects.all().order_by("id")
     serializer_class = DriverSerializer
 
 
@@ -92,7 +93,8 @@ class VehicleViewSet(ModelViewSet):
     Provides list, create, retrieve, update, and delete operations.
     """
 
-    queryset = Vehicle.objects.all().select_related("carrier").order_by("id")
+    # VehicleSerializer renders `carrier` as a primary key, so no join is needed
+    queryset = Vehicle.objects.all().order_by("id")
     serializer_class = VehicleSerializer
 
 
@@ -112,11 +114,9 @@ class ShipmentViewSet(ModelViewSet):
     Provides list, create, retrieve, update, and delete operations.
     """
 
-    queryset = (
-        Shipment.objects.all()
-        .select_related("carrier", "driver", "vehicle")
-        .order_by("id")
-    )
+    # ShipmentSerializer renders every foreign key as a primary key, read from the
+    # *_id columns, so none of the related tables are joined
+    queryset = Shipment.objects.all().order_by("id")
     serializer_class = ShipmentSerializer
 
 
@@ -126,16 +126,23 @@ class ShipmentItemViewSet(ModelViewSet):
     Provides list, create, retrieve, update, and delete operations.
     """
 
+    # Joins and selects only what the nested read-only serializers render: the asset's
+    # name/weight and the shipment's origin/destination names
     queryset = (
         ShipmentItem.objects.all()
-        .select_related(
+        .select_related("asset", "shipment__origin", "shipment__destination")
+        .only(
             "shipment",
-            "shipment__origin",
-            "shipment__destination",
-            "shipment__carrier",
-            "shipment__driver",
-            "shipment__vehicle",
             "asset",
+            "quantity",
+            "unit_weight_lb",
+            "notes",
+            "created_at",
+            "updated_at",
+            "asset__name",
+            "asset__weight_lb",
+            "shipment__origin__name",
+            "shipment__destination__name",
         )
         .order_by("id")
     )
@@ -110,6 +110,10 @@ DATABASES = {
         "PASSWORD": f"{POSTGRES_PASS}",
         "HOST": "localhost",
         "PORT": "5432",
+        # Reuse connections across requests instead of reconnecting for each one.
+        # Health checks drop connections the server closed before they are reused.
+        "CONN_MAX_AGE": int(os.getenv("DB_CONN_MAX_AGE", "60")),
+        "CONN_HEALTH_CHECKS": True,
     }
 }
 
@@ -8,13 +8,9 @@ models and relationships will evolve over time.
 """
 
 from graphviz import Digraph
+import hashlib
 import os
 
-dot = Digraph(comment="ReTrackLogistics ERD", format="png")
-dot.attr(rankdir="RL")
-dot.attr(size="12,6")
-dot.attr(dpi="200")
-
 entities = {
     "Carrier": [
         "id",
@@ -80,14 +76,6 @@ entities = {
     ],
 }
 
-for entity, fields in entities.items():
-    label = f"<<TABLE BORDER='0' CELLBORDER='1' CELLSPACING='0'>"
-    label += f"<TR><TD BGCOLOR='lightblue'><B>{entity}</B></TD></TR>"
-    for field in fields:
-        label += f"<TR><TD ALIGN='LEFT'>{field}</TD></TR>"
-    label += "</TABLE>>"
-    dot.node(entity, label=label, shape="plain")
-
 edges = [
     ("CarrierContact", "Carrier"),
     ("Driver", "Carrier"),
@@ -98,10 +86,71 @@ edges = [
     ("ShipmentStatusEvent", "Shipment"),
 ]
 
-for source, target in edges:
-    dot.edge(source, target)
+# Hierarchical `dot` layout slows down sharply as the schema grows; large diagrams
+# fall back to the force-directed `sfdp` engine unless DOT_ENGINE is set explicitly.
+SFDP_ENTITY_THRESHOLD = 25
+
+ERD_PATH = "ERD_2025-05-01"
+
+
+def build_erd() -> str:
+    """
+    Builds the ERD and renders it to `ERD_PATH`.png, skipping the Graphviz call when
+    the diagram definition is unchanged since the last render.
+
+    Returns:
+        str: Path of the rendered PNG.
+    """
+    default_engine = "sfdp" if len(entities) > SFDP_ENTITY_THRESHOLD else "dot"
+    dot = Digraph(
+        comment="ReTrackLogistics ERD",
+        format="png",
+        engine=os.environ.get("DOT_ENGINE", default_engine),
+    )
+    dot.attr(rankdir="RL")
+    dot.attr(size="12,6")
+    dot.attr(dpi="200")
+
+    for entity, fields in entities.items():
+        label = f"<<TABLE BORDER='0' CELLBORDER='1' CELLSPACING='0'>"
+        label += f"<TR><TD BGCOLOR='lightblue'><B>{entity}</B></TD></TR>"
+        for field in fields:
+            label += f"<TR><TD ALIGN='LEFT'>{field}</TD></TR>"
+        label += "</TABLE>>"
+        dot.node(entity, label=label, shape="plain")
+
+    for source, target in edges:
+        dot.edge(source, target)
+
+    erd_image_path = f"{ERD_PATH}.png"
+    hash_path = f"{ERD_PATH}.hash"
+
+    # Skip the Graphviz render when the DOT source (graph attributes, labels, nodes and
+    # edges) and layout engine haven't changed since the last run
+    digest = hashlib.blake2b(
+        f"{dot.engine}\n{dot.source}".encode(), digest_size=16
+    ).hexdigest()
+
+    previous_digest = None
+    if os.path.exists(hash_path):
+        with open(hash_path) as f:
+            previous_digest = f.read().strip()
+
+    if digest == previous_digest and os.path.exists(erd_image_path):
+        print(f"ERD unchanged, skipping render of {erd_image_path}")
+        return erd_image_path
+
+    # pipe() streams the PNG from Graphviz directly, skipping render()'s temporary DOT file.
+    # Rendered before opening the file so a Graphviz failure doesn't truncate the old PNG.
+    png = dot.pipe(format="png")
+    with open(erd_image_path, "wb") as f:
+        f.write(png)
+    with open(hash_path, "w") as f:
+        f.write(digest)
+
+    print(f"ERD generated at {erd_image_path}")
+    return erd_image_path
 
-erd_path = "ERD_2025-05-01"
-dot.render(erd_path, format="png", cleanup=True)
 
-print(f"ERD generated at {erd_path}.png")
+if __name__ == "__main__":
+    build_erd()